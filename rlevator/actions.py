@@ -1,7 +1,7 @@
-from enum import Enum
+from enum import IntEnum
 
 
-class Action(Enum):
+class Action(IntEnum):
     """
     There are 6 actions that an elevator can take:
     
@@ -18,6 +18,9 @@ class Action(Enum):
        starting from the first arrived passengers onward.
     5. Unload any passengers that have their destination floor as
        the elevator's current floor.
+
+    Actions are integers, so a raw action number from the action space can
+    be used anywhere an Action is expected.
     """
     WAIT = 0
     MOVE_UP = 1
@@ -25,13 +28,3 @@ class Action(Enum):
     LOAD_UP = 3
     LOAD_DOWN = 4
     UNLOAD = 5
-
-
-NUM_TO_ACTION = {
-    0: Action.WAIT,
-    1: Action.MOVE_UP,
-    2: Action.MOVE_DOWN,
-    3: Action.LOAD_UP,
-    4: Action.LOAD_DOWN,
-    5: Action.UNLOAD
-}
@@ -1,6 +1,92 @@
 from rlevator.passenger import Passenger
 
-from numpy import random
+from numpy import (allclose, arange, array, asarray, fill_diagonal, full, ones,
+                   random, repeat, where)
+
+
+# Number of time steps of Poisson arrivals drawn at once and then served one
+# step at a time by PassengerArrivals.generate_arrivals
+ARRIVAL_BUFFER_SIZE = 4096
+
+
+class AliasSampler(object):
+    """
+    Walker/Vose alias method sampler for a fixed set of categorical
+    distributions. The alias tables are built once, after which any number of
+    samples can be drawn in constant time each, from any of the distributions,
+    in a single vectorized call.
+    """
+
+    def __init__(self, probabilities, rng=None):
+        """
+        Build the alias tables for each row of a matrix of categorical
+        probabilities.
+
+        A sample from row r is drawn by picking a column c uniformly at random,
+        then keeping c with probability accept[r, c] or otherwise taking
+        alias[r, c].
+
+        Args:
+            probabilities : List[List[float]]
+                Matrix where each row is a categorical distribution. Rows do
+                not need to be exactly normalized.
+            rng : numpy.random.Generator
+                Random number generator to draw samples with. If None, a new
+                unseeded generator is created.
+        """
+        probabilities = asarray(probabilities, dtype=float)
+        num_rows, num_outcomes = probabilities.shape
+
+        accept = ones((num_rows, num_outcomes))
+        alias = repeat(arange(num_outcomes)[None, :], num_rows, axis=0)
+
+        for row in range(num_rows):
+            scaled = (probabilities[row] * num_outcomes
+                      / probabilities[row].sum()).tolist()
+            small = [i for i, p in enumerate(scaled) if p < 1]
+            large = [i for i, p in enumerate(scaled) if p >= 1]
+
+            while small and large:
+                less = small.pop()
+                more = large.pop()
+
+                accept[row, less] = scaled[less]
+                alias[row, less] = more
+
+                scaled[more] += scaled[less] - 1
+                if scaled[more] < 1:
+                    small.append(more)
+                else:
+                    large.append(more)
+
+            # Anything left over has a scaled probability of one, up to
+            # rounding error, so it keeps the default accept probability of one
+
+        self.num_outcomes = num_outcomes
+        self.accept = accept
+        self.alias = alias
+        self.rng = random.default_rng() if rng is None else rng
+
+    def sample(self, rows):
+        """
+        Draw one sample for each entry in rows from the distribution in that
+        row.
+
+        A single uniform draw per sample supplies both the candidate outcome
+        (integer part) and the accept test (fractional part).
+
+        Args:
+            rows : numpy.ndarray
+                Array of distribution row indices to sample from
+
+        Returns: numpy.ndarray
+            Array of sampled outcomes, parallel to rows
+        """
+        samples = self.rng.random(len(rows)) * self.num_outcomes
+        candidates = samples.astype(int)
+        keep = samples - candidates < self.accept[rows, candidates]
+
+        return where(keep, candidates, self.alias[rows, candidates])
 
 
 class PassengerArrivals(object):
@@ -14,7 +100,7 @@ class PassengerArrivals(object):
     """
 
     def __init__(self, num_floors, floor_arrival_rates,
-                 floor_destination_rates, max_wait_steps):
+                 floor_destination_rates, max_wait_steps, seed=None):
         """
         This class stores the parameters used to define how often Passengers
         arrive on each floor and what their destinations will be.
@@ -38,23 +124,110 @@ class PassengerArrivals(object):
                 This list should be the same length as the number of floors in
                 the Building, and each list within that list should also equal
                 the number of floors in the Building.
+            max_wait_steps : int
+                Maximum number of steps generated Passengers will wait in a
+                queue
+            seed : int
+                Seed for the generator's own random number generator. If None,
+                it is seeded from fresh OS entropy.
+        """
+        self.num_floors = num_floors
+        self.max_wait_steps = max_wait_steps
+
+        # Pre-drawn arrivals for upcoming time steps, refilled in a single
+        # Poisson call whenever every buffered step has been served
+        self._buf_size = ARRIVAL_BUFFER_SIZE
+        self._rng = random.default_rng(seed)
+
+        # Both setters validate the rates, and rebuild the arrival buffer and
+        # destination sampler that depend on them
+        self.floor_arrival_rates = floor_arrival_rates
+        self.floor_destination_rates = floor_destination_rates
+
+    @property
+    def floor_arrival_rates(self):
+        """
+        Read-only array of Poisson arrival rates for each floor. Assign a new
+        list of rates to change them, which discards any buffered arrivals so
+        the new rates apply from the next time step.
         """
-        if len(floor_arrival_rates) != num_floors:
+        return self._floor_arrival_rates
+
+    @floor_arrival_rates.setter
+    def floor_arrival_rates(self, floor_arrival_rates):
+        if len(floor_arrival_rates) != self.num_floors:
             raise Exception("The number of floor arrival rates should be "
                             "equal to the number of floors in the building")
 
-        if len(floor_destination_rates) != num_floors:
+        floor_arrival_rates = array(floor_arrival_rates, dtype=float)
+
+        if (floor_arrival_rates < 0).any():
+            raise Exception("Floor arrival rates cannot be negative")
+
+        floor_arrival_rates.flags.writeable = False
+        self._floor_arrival_rates = floor_arrival_rates
+
+        self._buf = None
+        self._buf_idx = self._buf_size
+
+    @property
+    def floor_destination_rates(self):
+        """
+        Read-only matrix of destination probabilities for each start floor.
+        Assign a new matrix to change them, which rebuilds the destination
+        sampler.
+        """
+        return self._floor_destination_rates
+
+    @floor_destination_rates.setter
+    def floor_destination_rates(self, floor_destination_rates):
+        if len(floor_destination_rates) != self.num_floors:
             raise Exception("The number of floor destination rates should be "
                             "equal to the number of floors in the building")
 
-        if len(floor_destination_rates[0]) != num_floors:
+        if any(len(rates) != self.num_floors
+               for rates in floor_destination_rates):
             raise Exception("The floor destination rates for each floor "
                             "should be equal to the number of floors")
 
-        self.num_floors = num_floors
-        self.floor_arrival_rates = floor_arrival_rates
-        self.floor_destination_rates = floor_destination_rates
-        self.max_wait_steps = max_wait_steps
+        floor_destination_rates = array(floor_destination_rates, dtype=float)
+
+        if (floor_destination_rates < 0).any():
+            raise Exception("Floor destination rates cannot be negative")
+
+        if not allclose(floor_destination_rates.sum(axis=1), 1):
+            raise Exception("The floor destination rates for each floor "
+                            "should sum to one")
+
+        if floor_destination_rates.diagonal().any():
+            raise Exception("The floor destination rate for a passenger's "
+                            "start floor should be zero")
+
+        floor_destination_rates.flags.writeable = False
+        self._floor_destination_rates = floor_destination_rates
+
+        # Sampler over every start floor's destination distribution so each
+        # arrival's destination is drawn in constant time
+        self._destination_sampler = AliasSampler(floor_destination_rates,
+                                                 self._rng)
+
+    def seed(self, seed=None):
+        """
+        Reset the generator's random number generator, which is local to this
+        instance so that independent generators, such as ones in parallel
+        workers, produce independent and reproducible streams. Any buffered
+        arrivals are discarded.
+
+        Args:
+            seed : int
+                Seed for the random number generator. If None, it is seeded
+                from fresh OS entropy.
+        """
+        self._rng = random.default_rng(seed)
+        self._destination_sampler.rng = self._rng
+
+        self._buf = None
+        self._buf_idx = self._buf_size
 
     @staticmethod
     def generate_default_params(num_elevators, num_floors):
@@ -80,8 +253,8 @@ class PassengerArrivals(object):
 
         Returns: Dict
             Dictionary containing floor_arrival_rates and
-            floor_destination_rates with sizes num_floors and num_floors x
-            num_floors, respectively.
+            floor_destination_rates as numpy arrays with shapes num_floors and
+            num_floors x num_floors, respectively.
         """
         GROUND_FLOOR_LAMBDA = 0.1 * num_elevators
         OTHER_FLOOR_LAMBDA = 0.2 * num_elevators / num_floors
@@ -89,27 +262,17 @@ class PassengerArrivals(object):
         GROUND_FLOOR_DEST_PROB = 0.9
         OTHER_FLOOR_DEST_PROB = (1 - GROUND_FLOOR_DEST_PROB) / (num_floors - 2)
 
-        floor_arrival_rates = [GROUND_FLOOR_LAMBDA]
-
         MAX_WAIT_STEPS = 50
 
-        for _ in range(num_floors - 1):
-            floor_arrival_rates.append(OTHER_FLOOR_LAMBDA)
+        floor_arrival_rates = full(num_floors, OTHER_FLOOR_LAMBDA)
+        floor_arrival_rates[0] = GROUND_FLOOR_LAMBDA
 
-        floor_destination_rates = [
-            [0] + [1 / (num_floors - 1) for _ in range(num_floors - 1)]
-        ]
+        floor_destination_rates = full((num_floors, num_floors),
+                                       OTHER_FLOOR_DEST_PROB)
+        floor_destination_rates[:, 0] = GROUND_FLOOR_DEST_PROB
+        floor_destination_rates[0, :] = 1 / (num_floors - 1)
+        fill_diagonal(floor_destination_rates, 0)
 
-        for i in range(1, num_floors):
-            floor_probs = []
-            for j in range(0, num_floors):
-                if j == 0:
-                    floor_probs.append(GROUND_FLOOR_DEST_PROB)
-                elif i == j:
-                    floor_probs.append(0)
-                else:
-                    floor_probs.append(OTHER_FLOOR_DEST_PROB)
-            floor_destination_rates.append(floor_probs)
         return {
             'num_floors': num_floors,
             'floor_arrival_rates': floor_arrival_rates,
@@ -119,43 +282,55 @@ class PassengerArrivals(object):
 
     def generate_arrivals(self):
         """
-        Use the Poisson distribution sampling to generate the numbe  r of
+        Use the Poisson distribution sampling to generate the number of
         Passenger arrivals on each floor in the time step.
 
-        Returns: List[int]
-            Returns a list of the number of Passenger arrivals on each floor.
-            List length should equal the number of floors in the building.
+        Arrivals are drawn for ARRIVAL_BUFFER_SIZE time steps at once and
+        served from an internal buffer, which amortizes the cost of calling
+        into numpy over many steps.
+
+        Returns: numpy.ndarray
+            Returns an array of the number of Passenger arrivals on each
+            floor. Array length should equal the number of floors in the
+            building.
         """
-        return random.poisson(self.floor_arrival_rates).tolist()
+        if self._buf_idx == self._buf_size:
+            self._buf = self._rng.poisson(
+                self.floor_arrival_rates,
+                size=(self._buf_size, self.num_floors)
+            )
+            self._buf_idx = 0
+
+        arrivals = self._buf[self._buf_idx]
+        self._buf_idx += 1
+
+        return arrivals
 
     def assign_destinations(self, arrivals):
         """
-        For each arrival on each floor, generate a generation using the
+        For each arrival on each floor, generate a destination using the
         pre-defined probabilities for each start floor.
 
+        All destinations are drawn at once from the start floors'
+        destination distributions with an AliasSampler.
+
         Args:
-            arrivals : List[int]
-                List of the number of Passenger arrivals on each floor
+            arrivals : numpy.ndarray
+                Array of the number of Passenger arrivals on each floor
 
-        Returns: List[Dict]
-            Returns a flattened list of dictionaries with start_floor and
-            destination_floor for each arrived passenger.
+        Returns: Tuple[numpy.ndarray, numpy.ndarray]
+            Returns two parallel arrays containing the start_floor and
+            destination_floor for each arrived passenger, ordered by start
+            floor.
         """
-        floor_options = [i for i in range(self.num_floors)]
-        destinations = []
+        start_floors = repeat(arange(self.num_floors), arrivals)
+
+        if not start_floors.size:
+            return start_floors, start_floors
 
-        for floor, arrival_num in enumerate(arrivals):
-            for _ in range(arrival_num):
-                destination_floor = random.choice(
-                    floor_options,
-                    p=self.floor_destination_rates[floor]
-                )
-                destinations.append({
-                    'start_floor': floor,
-                    'destination_floor': destination_floor
-                })
+        destination_floors = self._destination_sampler.sample(start_floors)
 
-        return destinations
+        return start_floors, destination_floors
 
     def generate_passengers(self, curr_time_step):
         """
@@ -171,15 +346,17 @@ class PassengerArrivals(object):
                 List of passengers to be added to the building's queues
         """
         arrivals = self.generate_arrivals()
-        dest_info = self.assign_destinations(arrivals)
+        start_floors, destination_floors = self.assign_destinations(arrivals)
 
         new_passengers = []
 
-        for passenger_params in dest_info:
-            passenger_params.update({
-                'start_step': curr_time_step,
-                'max_wait_steps': self.max_wait_steps
-            })
-            new_passengers.append(Passenger(**passenger_params))
+        for start_floor, destination_floor in zip(start_floors.tolist(),
+                                                  destination_floors.tolist()):
+            new_passengers.append(Passenger(
+                start_step=curr_time_step,
+                start_floor=start_floor,
+                destination_floor=destination_floor,
+                max_wait_steps=self.max_wait_steps
+            ))
 
         return new_passengers
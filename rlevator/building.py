@@ -1,7 +1,36 @@
 from rlevator.elevator import Elevator
 from rlevator.actions import Action
 
-from numpy import array
+from collections import deque
+from itertools import chain
+
+from numpy import zeros
+
+
+def _per_elevator(value, num_elevators, name):
+    """
+    Normalize an elevator parameter that is either a single integer shared by
+    every elevator or a list with one integer per elevator.
+
+    Args:
+        value : Union[int, List[int]]
+            Parameter value to normalize
+        num_elevators : int
+            Number of elevators in the building
+        name : str
+            Parameter name used in the error message
+
+    Returns: List[int]
+        List of num_elevators integers
+    """
+    if type(value) is int:
+        return [value] * num_elevators
+
+    if len(value) != num_elevators:
+        raise Exception(name + " should either be an integer or a list of "
+                        "integers equal to the number of elevators.")
+
+    return list(value)
 
 
 class Building(object):
@@ -28,9 +57,9 @@ class Building(object):
                 the building or a list of num_elevators integers defining each
                 individual elevator's capacity
             elevator_start_floors : Union[int, List[int]]
-                Either an integer defining the capacity of all elevators in
+                Either an integer defining the start floor of all elevators in
                 the building or a list of num_elevators integers defining each
-                individual elevator's capacity
+                individual elevator's start floor
 
                 If None, all elevators start at floor zero
             elevator_bounds : List[List[int]]
@@ -47,6 +76,18 @@ class Building(object):
         self.elevator_start_floors = elevator_start_floors
         self.elevator_bounds = elevator_bounds
 
+        # Methods that execute each Action, keyed by the Action's value. Only
+        # valid values are keys, so a lookup also validates the action without
+        # constructing an Action.
+        self._action_table = {
+            Action.WAIT.value: self.wait,
+            Action.MOVE_UP.value: self.move_up,
+            Action.MOVE_DOWN.value: self.move_down,
+            Action.LOAD_UP.value: self.load_up,
+            Action.LOAD_DOWN.value: self.load_down,
+            Action.UNLOAD.value: self.unload
+        }
+
         self.reset()
 
     def reset(self):
@@ -58,15 +99,17 @@ class Building(object):
         self._initialize_queues()
         # Initialize elevators with appropriate parameters
         self._initialize_elevators()
+        # Initialize the reusable observation arrays
+        self._initialize_observation()
 
     def _initialize_queues(self):
         """
-        Create two lists for each floor to contain Passengers with destinations
-        above and below them. Passengers will be loaded onto an elevator only
-        from one queue at a time, with FIFO logic.
+        Create two deques for each floor to contain Passengers with
+        destinations above and below them. Passengers will be loaded onto an
+        elevator only from one queue at a time, with FIFO logic.
         """
-        self.up_queues = [list() for _ in range(self.num_floors)]
-        self.down_queues = [list() for _ in range(self.num_floors)]
+        self.up_queues = [deque() for _ in range(self.num_floors)]
+        self.down_queues = [deque() for _ in range(self.num_floors)]
         self.rejected_queue_passengers = []
         self.deboarding_passengers = []
         self.reached_max_wait_passengers = []
@@ -85,62 +128,64 @@ class Building(object):
                 individual elevator's
                 capacity
             elevator_start_floors : Union[int, List[int]]
-                Either an integer defining the capacity of all elevators in the
-                building or a list of num_elevators integers defining each
-                individual elevator's capacity
+                Either an integer defining the start floor of all elevators in
+                the building or a list of num_elevators integers defining each
+                individual elevator's start floor
 
                 If None, all elevators start at floor zero
             elevator_bounds : List[List[int]]
                 Either None or a list of lists of num_elevators integers
                 defining each individual elevator's minimum and maximum floors
         """
-        # Input error checking
+        # Input error checking and normalization to one value per elevator
         if self.elevator_capacities is None:
             raise Exception("Elevator capacities cannot be None")
-        elif type(self.elevator_capacities) is not int:
-            if len(self.elevator_capacities) < self.num_elevators:
-                raise Exception("Elevator capacities should either be an "
-                                "integer or a list of integers equal to the "
-                                "number of elevators.")
-
-        if self.elevator_start_floors is not None:
-            if len(self.elevator_start_floors) != self.num_elevators:
-                raise Exception("Elevator start floor should either be None "
-                                "or a list of integers equal to the number of "
-                                "elevators.")
-
-        if self.elevator_bounds is not None:
-            if len(self.elevator_bounds) != self.num_elevators:
-                raise Exception("Elevator bounds should either be None or a "
-                                "list of list  integers equal to the number "
-                                "of elevators.")
-
-        elevators = []
-
-        for i in range(self.num_elevators):
-            if self.elevator_start_floors is None:
-                start_floor = 0
-            else:
-                start_floor = self.elevator_start_floors[i]
+        capacities = _per_elevator(self.elevator_capacities,
+                                   self.num_elevators, "Elevator capacities")
 
-            if type(self.elevator_capacities) is int:
-                capacity = self.elevator_capacities
-            else:
-                capacity = self.elevator_capacities[i]
+        if self.elevator_start_floors is None:
+            start_floors = [0] * self.num_elevators
+        else:
+            start_floors = _per_elevator(self.elevator_start_floors,
+                                         self.num_elevators,
+                                         "Elevator start floors")
+
+        if self.elevator_bounds is None:
+            bounds = [(0, self.num_floors - 1)] * self.num_elevators
+        elif len(self.elevator_bounds) != self.num_elevators:
+            raise Exception("Elevator bounds should either be None or a "
+                            "list of list  integers equal to the number "
+                            "of elevators.")
+        else:
+            bounds = self.elevator_bounds
 
-            if self.elevator_bounds is None:
-                min_floor = 0
-                max_floor = self.num_floors - 1
-            else:
-                min_floor = self.elevator_bounds[i][0]
-                max_floor = self.elevator_bounds[i][1]
+        elevators = []
 
+        for start_floor, capacity, (min_floor, max_floor) in zip(
+                start_floors, capacities, bounds):
             elevators.append(
                 Elevator(start_floor, capacity, min_floor, max_floor)
             )
 
         self.elevators = elevators
 
+    def _initialize_observation(self):
+        """
+        Preallocate the arrays returned by get_observation_limited so they can
+        be refreshed in place each step instead of being rebuilt.
+        """
+        self._obs_elevator_buttons = zeros(
+            (self.num_elevators, self.num_floors), dtype=bool
+        )
+        self._obs_queue_buttons = zeros((2, self.num_floors), dtype=bool)
+        self._obs_elevator_floors = zeros(self.num_elevators, dtype=int)
+
+        self._observation = {
+            'elevator_buttons': self._obs_elevator_buttons,
+            'queue_buttons': self._obs_queue_buttons,
+            'elevator_floors': self._obs_elevator_floors
+        }
+
     def get_queue(self, floor, up=False):
         """
         Get a queue of passengers on a given floor.
@@ -152,12 +197,22 @@ class Building(object):
                 Boolean denoting whether to get the up floor if True
                 or the down floor is False
 
-        Returns: List[Passenger]
+        Returns: Deque[Passenger]
         """
         if up:
             return self.up_queues[floor]
         return self.down_queues[floor]
 
+    def _iter_queues(self):
+        """
+        Iterate over every up and down queue, for passes that treat both
+        directions the same. The queue lists are read on each call, so queues
+        replaced in up_queues or down_queues are always included.
+
+        Returns: Iterator[Deque[Passenger]]
+        """
+        return chain(self.up_queues, self.down_queues)
+
     def execute_step(self, arrived_passengers, action_list):
         """
         Process a full step in the building, including pre-processing,
@@ -171,14 +226,24 @@ class Building(object):
             arrived_passengers : List[Passenger]
                 List of passengers that arrived at queues
             action_list : List[Action]
-                List of Actions to be taken, one for each elevator in the
-                building
+                List of Actions or their integer values to be taken, one for
+                each elevator in the building
         """
         if len(action_list) != self.num_elevators:
             raise Exception("The number of actions provided must match the "
                             "number of elevators")
 
-        # Preprocessing, reset step tracking values
+        # Resolve every handler up front so an invalid action raises before
+        # any state has changed
+        action_table = self._action_table
+        try:
+            handlers = [action_table[action] for action in action_list]
+        except KeyError as error:
+            raise ValueError("Invalid action: " + str(error)) from None
+
+        # Preprocessing, reset step tracking values. The passenger tracking
+        # lists are replaced rather than cleared, since the lists handed out
+        # by get_reward_components and the getters belong to the caller.
         self.deboarding_passengers = []
         self.rejected_queue_passengers = []
         self.reached_max_wait_passengers = []
@@ -191,9 +256,13 @@ class Building(object):
         # Add new passengers to queues
         self.add_arrivals_to_queues(arrived_passengers)
 
-        # Execute actions
-        for elevator_num, action in enumerate(action_list):
-            self.execute_action(elevator_num, action)
+        # Execute actions, calling the resolved handlers directly to skip an
+        # execute_action call per elevator. WAIT does nothing, so those
+        # elevators are skipped entirely.
+        wait = action_table[Action.WAIT]
+        for elevator_num, handler in enumerate(handlers):
+            if handler is not wait:
+                handler(elevator_num)
 
         # Post processing
         self._increment_step()
@@ -205,13 +274,12 @@ class Building(object):
         Go through all queues and remove passengers that have reached their
         max wait time.
         """
-        for i, queue in enumerate(self.up_queues):
-            new_queue = self.remove_max_wait_from_queue(queue)
-            self.up_queues[i] = new_queue
+        for queue in self._iter_queues():
+            # Most queues are empty, so skip them without a call
+            if not queue:
+                continue
 
-        for i, queue in enumerate(self.down_queues):
-            new_queue = self.remove_max_wait_from_queue(queue)
-            self.down_queues[i] = new_queue
+            self._remove_max_wait_from_queue(queue)
 
     def remove_max_wait_from_queue(self, queue):
         """
@@ -220,15 +288,15 @@ class Building(object):
         that tracks passengers who have voluntarily left the queue.
 
         Returns the updated queue with passengers who have not reached their
-        max wait time.
+        max wait time. The queue passed in is left unchanged.
 
         Args:
-            queue : List[Passenger]
+            queue : Deque[Passenger]
                 Elevator queue of passengers to be checked for max wait times
 
-        Returns: List[Passenger]
+        Returns: Deque[Passenger]
         """
-        new_queue = []
+        new_queue = deque()
         for passenger in queue:
             if passenger.reached_max_wait():
                 self.reached_max_wait_passengers.append(passenger)
@@ -237,16 +305,70 @@ class Building(object):
 
         return new_queue
 
+    def _remove_max_wait_from_queue(self, queue):
+        """
+        In place version of remove_max_wait_from_queue used by
+        remove_max_wait_passengers.
+
+        The queue is filtered by rotating each remaining passenger from the
+        front to the back, so its order is preserved and no new queue is
+        allocated. If nobody has reached their max wait time, the queue is
+        left untouched.
+
+        Args:
+            queue : Deque[Passenger]
+                Elevator queue of passengers to be checked for max wait times
+
+        Returns: int
+            Number of passengers removed from the queue
+        """
+        for passenger in queue:
+            if passenger.reached_max_wait():
+                break
+        else:
+            return 0
+
+        num_removed = 0
+        for _ in range(len(queue)):
+            passenger = queue.popleft()
+            if passenger.reached_max_wait():
+                self.reached_max_wait_passengers.append(passenger)
+                num_removed += 1
+            else:
+                queue.append(passenger)
+
+        return num_removed
+
     def add_arrivals_to_queues(self, passengers):
         """
         Process all new passenger arrivals by adding them to the appropriate
         floor queues.
 
+        Every arrival is routed in a single pass. Passengers can never be
+        created with equal start and destination floors, since the Passenger
+        constructor rejects them, so a single comparison decides between the
+        up and down queue.
+
         Args:
             passengers : List[Passenger]
         """
+        up_queues = self.up_queues
+        down_queues = self.down_queues
+        max_queue = self.max_queue
+        rejected_queue_passengers = self.rejected_queue_passengers
+
         for passenger in passengers:
-            self.add_passenger_to_queue(passenger)
+            start_floor = passenger.start_floor
+
+            if passenger.destination_floor > start_floor:
+                try_queue = up_queues[start_floor]
+            else:
+                try_queue = down_queues[start_floor]
+
+            if len(try_queue) < max_queue:
+                try_queue.append(passenger)
+            else:
+                rejected_queue_passengers.append(passenger)
 
     def add_passenger_to_queue(self, passenger):
         """
@@ -258,24 +380,14 @@ class Building(object):
         queue because it was too long, to be included in the reward function
         penalty.
 
+        This is a thin wrapper around add_arrivals_to_queues, which routes
+        passengers the same way in batches.
+
         Args:
             passenger : Passenger
                 Passenger arrival to be processed
         """
-        start_floor = passenger.get_start_floor()
-
-        if passenger.get_destination_floor() > start_floor:
-            try_queue = self.up_queues[start_floor]
-        elif passenger.get_destination_floor() < start_floor:
-            try_queue = self.down_queues[start_floor]
-        else:
-            raise Exception("Passenger's destination floor cannot be the same "
-                            "as start floor")
-
-        if len(try_queue) < self.max_queue:
-            try_queue.append(passenger)
-        else:
-            self.rejected_queue_passengers.append(passenger)
+        self.add_arrivals_to_queues([passenger])
 
     def get_rejected_queue_passengers(self):
         """
@@ -303,32 +415,27 @@ class Building(object):
             elevator_num : int
                 Index of the elevator to take the action
             action : Action
-                Action ENUM specifying which action to perform
-        """
-        # NOTE: Choosing to not use match capability in python 3.10
-        # for compatibility
-        if action == Action.MOVE_DOWN:
-            self.move_down(elevator_num)
-        elif action == Action.MOVE_UP:
-            self.move_up(elevator_num)
-        elif action == Action.WAIT:
-            self.wait(elevator_num)
-        elif action == Action.LOAD_UP:
-            self.load_up(elevator_num)
-        elif action == Action.LOAD_DOWN:
-            self.load_down(elevator_num)
-        elif action == Action.UNLOAD:
-            self.unload(elevator_num)
+                Action ENUM or its integer value specifying which action to
+                perform
+        """
+        try:
+            handler = self._action_table[action]
+        except KeyError:
+            raise ValueError("Invalid action: " + str(action)) from None
+
+        handler(elevator_num)
 
     def move_down(self, elevator_num):
-        start_floor = self.elevators[elevator_num].get_current_floor()
-        self.elevators[elevator_num].move(-1)
-        self.update_move_direction_counts(elevator_num, start_floor)
+        elevator = self.elevators[elevator_num]
+        start_floor = elevator.floor
+        elevator.move(-1)
+        self._update_move_direction_counts(elevator, start_floor)
 
     def move_up(self, elevator_num):
-        start_floor = self.elevators[elevator_num].get_current_floor()
-        self.elevators[elevator_num].move(1)
-        self.update_move_direction_counts(elevator_num, start_floor)
+        elevator = self.elevators[elevator_num]
+        start_floor = elevator.floor
+        elevator.move(1)
+        self._update_move_direction_counts(elevator, start_floor)
 
     def wait(self, elevator_num):
         """
@@ -341,66 +448,72 @@ class Building(object):
 
     def load_up(self, elevator_num):
         elevator = self.elevators[elevator_num]
-        queue = self.up_queues[elevator.get_current_floor()]
-
-        self.load(elevator, queue)
+        self.load(elevator, self.up_queues[elevator.floor])
 
     def load_down(self, elevator_num):
         elevator = self.elevators[elevator_num]
-        queue = self.down_queues[elevator.get_current_floor()]
-
-        self.load(elevator, queue)
+        self.load(elevator, self.down_queues[elevator.floor])
 
     def unload(self, elevator_num):
-        elevator = self.elevators[elevator_num]
-        self.deboarding_passengers += elevator.unload_passengers()
+        unloaded_passengers = self.elevators[elevator_num].unload_passengers()
+        self.deboarding_passengers.extend(unloaded_passengers)
 
     def load(self, elevator, queue):
         """
         For a given elevator and queue on the same floor, attempt to fill the
         available spaces on the elevator from the queue as long as there are
         passengers left in the queue. We take passengers from the first in the
-        list.
+        queue.
 
         Args:
-            elevator_num : int
-                Index of the elevator to take the action
-            queue : List[Passenger]
+            elevator : Elevator
+                Elevator to load the passengers onto
+            queue : Deque[Passenger]
                 Elevator queue of Passengers waiting to board in the specified
                 direction.
         """
-        boarding_passengers = []
-        available_capacity = elevator.available_capacity()
-
-        for _ in range(available_capacity):
-            if len(queue) > 0:
-                boarding_passengers.append(queue.pop(0))
+        # Read the elevator's state directly since this runs on every load
+        num_boarding = min(elevator.capacity - len(elevator.passengers),
+                           len(queue))
 
-        elevator.load_passengers(boarding_passengers)
+        if num_boarding:
+            if num_boarding == len(queue):
+                # The whole queue fits, so move it in one bulk copy
+                boarding_passengers = list(queue)
+                queue.clear()
+            else:
+                boarding_passengers = [queue.popleft()
+                                       for _ in range(num_boarding)]
+            elevator.load_passengers(boarding_passengers)
 
     def update_move_direction_counts(self, elevator_num, start_floor):
-        elevator = self.elevators[elevator_num]
-        self.count_correct_direction_passengers += \
-            elevator.count_correct_move_passengers(start_floor)
-        self.count_incorrect_direction_passengers += \
-            elevator.count_incorrect_move_passengers(start_floor)
+        self._update_move_direction_counts(self.elevators[elevator_num],
+                                           start_floor)
+
+    def _update_move_direction_counts(self, elevator, start_floor):
+        correct_count, incorrect_count = \
+            elevator.count_move_passengers(start_floor)
+
+        self.count_correct_direction_passengers += correct_count
+        self.count_incorrect_direction_passengers += incorrect_count
 
     def _increment_step(self):
         """
         Increment a time step forwards for all passengers both in and out
         of elevators.
-        """
-        for queue in self.up_queues:
-            for passenger in queue:
-                passenger.increment_step(in_elevator=False)
 
-        for queue in self.down_queues:
+        This runs every step for every passenger in the building, so the
+        counters are updated directly rather than through
+        Passenger.increment_step, with the same result.
+        """
+        for queue in self._iter_queues():
             for passenger in queue:
-                passenger.increment_step(in_elevator=False)
+                passenger.steps_wait += 1
+                passenger.steps_age += 1
 
         for elevator in self.elevators:
             for passenger in elevator.passengers:
-                passenger.increment_step(in_elevator=True)
+                passenger.steps_age += 1
 
     def elevator_destination_bool_list(self):
         """
@@ -444,14 +557,12 @@ class Building(object):
             representing whether or not the up/down buttons are pressed by a
             nonzero number of passengers in the queue, respectively.
         """
-        up_buttons = []
-        down_buttons = []
-
-        for i in range(self.num_floors):
-            up_buttons.append(len(self.up_queues[i]) > 0)
-            down_buttons.append(len(self.down_queues[i]) > 0)
-
-        return [up_buttons, down_buttons]
+        # Read straight from the queues so that every way of changing them,
+        # including the deques returned by get_queue, is reflected
+        return [
+            list(map(bool, self.up_queues)),
+            list(map(bool, self.down_queues))
+        ]
 
     def get_reward_components(self):
         """
@@ -491,16 +602,14 @@ class Building(object):
         components['count_incorrect_direction_passengers'] = \
             self.count_incorrect_direction_passengers
 
-        passengers_elevator = 0
-        for elevator in self.elevators:
-            passengers_elevator += elevator.get_count_passengers()
-        components['passengers_elevator'] = passengers_elevator
+        # Counted from the elevators themselves so that passengers loaded or
+        # unloaded directly through an Elevator are included
+        components['passengers_elevator'] = sum(
+            len(elevator.passengers) for elevator in self.elevators
+        )
 
-        passengers_queue = 0
-        for i in range(self.num_floors):
-            passengers_queue += len(self.up_queues[i])
-            passengers_queue += len(self.down_queues[i])
-        components['passengers_queues'] = passengers_queue
+        # Counted from the queues themselves, for the same reason
+        components['passengers_queues'] = sum(map(len, self._iter_queues()))
 
         return components
 
@@ -514,21 +623,34 @@ class Building(object):
         pressed the destination buttons. Additionally, the elevators know what
         floors they are currently on.
 
+        The returned arrays are owned by the building and are overwritten in
+        place on the next call, so copy them to keep an observation around.
+
         Returns: dict
             Returns a dictionary containing two numpy arrays of boolean
 
         """
-        observation = dict()
+        # Rebuilt on every call so that changes made directly through the
+        # elevators are always reflected. Only each elevator's small set of
+        # destinations is visited, not every floor.
+        elevator_buttons = self._obs_elevator_buttons
+        elevator_buttons[:] = False
 
-        observation['elevator_buttons'] = array(
-            self.elevator_destination_bool_list(), dtype=bool
-        )
-        observation['queue_buttons'] = array(
-            self.queue_request_button_statuses(), dtype=bool
-        )
+        # Floors outside the elevator's bounds have no button, matching
+        # Elevator.get_destination_bool_list.
+        for i, elevator in enumerate(self.elevators):
+            min_floor = elevator.min_floor
+            max_floor = elevator.max_floor
+            for floor in elevator.destinations:
+                if min_floor <= floor <= max_floor:
+                    elevator_buttons[i, floor] = True
+
+        # Read straight from the queues, as in queue_request_button_statuses
+        self._obs_queue_buttons[0] = list(map(bool, self.up_queues))
+        self._obs_queue_buttons[1] = list(map(bool, self.down_queues))
 
-        observation['elevator_floors'] = array([
-            elevator.get_current_floor() for elevator in self.elevators
-        ], dtype=int)
+        self._obs_elevator_floors[:] = [
+            elevator.floor for elevator in self.elevators
+        ]
 
-        return observation
+        return self._observation
@@ -1,4 +1,8 @@
 class Elevator(object):
+    # Elevator attributes are read on every action, so avoid a per-instance
+    # dict
+    __slots__ = ('floor', 'passengers', 'min_floor', 'max_floor', 'capacity',
+                 'destinations')
 
     def __init__(self, start_floor, capacity, min_floor, max_floor):
         """
@@ -47,13 +51,16 @@ class Elevator(object):
         Returns the boolean list of destination identifiers for each floor
         starting at the min_floor and working upwards
         """
-        destinations = []
+        min_floor = self.min_floor
+        max_floor = self.max_floor
+        destinations = [False] * (max_floor - min_floor + 1)
 
-        for floor in range(self.min_floor, self.max_floor + 1):
-            if floor in self.destinations:
-                destinations.append(True)
-            else:
-                destinations.append(False)
+        # Only visit the floors that are destinations rather than every floor.
+        # Passengers can board with a destination the elevator cannot reach,
+        # and those floors have no button in the list.
+        for floor in self.destinations:
+            if min_floor <= floor <= max_floor:
+                destinations[floor - min_floor] = True
 
         return destinations
 
@@ -101,10 +108,14 @@ class Elevator(object):
             floor_diff : int
                 Integer number of floors to move based on floor number.
         """
-        new_floor = max(
-            min(self.floor + floor_diff, self.max_floor),
-            self.min_floor
-        )
+        # Plain comparisons rather than min/max, which are noticeably slower
+        # here because of the builtin call overhead
+        new_floor = self.floor + floor_diff
+
+        if new_floor > self.max_floor:
+            new_floor = self.max_floor
+        elif new_floor < self.min_floor:
+            new_floor = self.min_floor
 
         self.floor = new_floor
 
@@ -119,9 +130,12 @@ class Elevator(object):
             raise Exception("The elevator cannot handle this many passengers "
                             "and will be over capacity")
 
-        self.passengers += passengers
+        self.passengers.extend(passengers)
 
-        self._update_destinations()
+        # Boarding can only add destinations, so extend the set in place
+        # rather than rebuilding it from every passenger
+        for passenger in passengers:
+            self.destinations.add(passenger.destination_floor)
 
     def unload_passengers(self):
         """
@@ -133,18 +147,27 @@ class Elevator(object):
         Returns:
             List[Passenger]
         """
+        # Nobody on board is headed for this floor, so there is nothing to
+        # scan for
+        if self.floor not in self.destinations:
+            return []
+
+        floor = self.floor
         unload_passengers = []
         stay_passengers = []
 
+        # Single pass partition, with Passenger.reached_destination inlined
         for passenger in self.passengers:
-            if passenger.reached_destination(self.floor):
+            if passenger.destination_floor == floor:
                 unload_passengers.append(passenger)
             else:
                 stay_passengers.append(passenger)
 
         self.passengers = stay_passengers
 
-        self._update_destinations()
+        # Every passenger headed for this floor has just left, and nobody
+        # else's destination changed
+        self.destinations.discard(floor)
 
         return unload_passengers
 
@@ -163,11 +186,27 @@ class Elevator(object):
             int
                 Number of passengers with the desired move direction.
         """
+        end_floor = self.floor
+
+        if end_floor == start_floor:
+            return 0
+
+        # Same test as Passenger.moved_correct_direction, inlined since this
+        # runs for every passenger on every move. The end floor is closer to a
+        # destination than the start floor exactly when the destination is
+        # past the midpoint of the move, so each passenger needs only a single
+        # comparison against twice that midpoint.
+        floor_sum = start_floor + end_floor
         move_count = 0
 
-        for passenger in self.passengers:
-            if passenger.moved_correct_direction(start_floor, self.floor):
-                move_count += 1
+        if end_floor > start_floor:
+            for passenger in self.passengers:
+                if 2 * passenger.destination_floor > floor_sum:
+                    move_count += 1
+        else:
+            for passenger in self.passengers:
+                if 2 * passenger.destination_floor < floor_sum:
+                    move_count += 1
 
         return move_count
 
@@ -186,13 +225,29 @@ class Elevator(object):
             int
                 Number of passengers with the incorrect move direction.
         """
-        move_count = 0
+        return (len(self.passengers)
+                - self.count_correct_move_passengers(start_floor))
 
-        for passenger in self.passengers:
-            if not passenger.moved_correct_direction(start_floor, self.floor):
-                move_count += 1
+    def count_move_passengers(self, start_floor):
+        """
+        After an elevator has moved, count the number of passengers for which
+        the move was in the correct and incorrect directions for their
+        destinations, with a single pass over the passengers.
 
-        return move_count
+        Args:
+            start_floor : int
+                The previous floor that the elevator was on before moving. The
+                end floor is the current floor the elevator is on since it has
+                already moved.
+
+        Returns:
+            Tuple[int, int]
+                Number of passengers with the correct and incorrect move
+                direction, respectively.
+        """
+        correct_count = self.count_correct_move_passengers(start_floor)
+
+        return correct_count, len(self.passengers) - correct_count
 
     def increment_passenger_steps(self):
         """
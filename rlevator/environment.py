@@ -1,10 +1,11 @@
 from rlevator.arrivals import PassengerArrivals
 from rlevator.building import Building
-from rlevator.actions import Action, NUM_TO_ACTION
+from rlevator.actions import Action
 
 import gymnasium as gym
 
 from gymnasium import spaces
+from numpy import arange, zeros
 
 
 # TODO: these need testing to determine decent defaults
@@ -108,9 +109,39 @@ class RLevatorEnv(gym.Env):
             else:
                 self.observation_space = \
                     spaces.utils.flatten_space(self.limited_obs_space)
+                self._initialize_flat_obs(num_floors, num_elevators)
         else:
             raise Exception("This observation type is not implemented yet.")
 
+    def _initialize_flat_obs(self, num_floors, num_elevators):
+        """
+        Preallocate the flattened limited observation so each step fills it in
+        place rather than concatenating freshly flattened components.
+
+        The layout matches spaces.utils.flatten on the limited observation
+        space: the elevator buttons, then the queue buttons, then a one-hot
+        encoding of each elevator's floor.
+
+        Args:
+            num_floors : int
+                Number of floors in the building
+            num_elevators : int
+                Number of elevators in the building
+        """
+        self._flat_obs = zeros(self.observation_space.shape,
+                               dtype=self.observation_space.dtype)
+
+        elevator_buttons_end = num_elevators * num_floors
+        queue_buttons_end = elevator_buttons_end + 2 * num_floors
+
+        self._flat_elevator_buttons = self._flat_obs[:elevator_buttons_end]
+        self._flat_queue_buttons = \
+            self._flat_obs[elevator_buttons_end:queue_buttons_end]
+        self._flat_elevator_floors = \
+            self._flat_obs[queue_buttons_end:].reshape(num_elevators,
+                                                       num_floors)
+        self._elevator_indices = arange(num_elevators)
+
     def reset(self, seed=None):
         """
         Resets the environment, including the building, elevator and
@@ -118,10 +149,15 @@ class RLevatorEnv(gym.Env):
 
         Args:
             seed : int
-                Random seed to provide to the gym environment
+                Random seed to provide to the gym environment. It also reseeds
+                the passenger generator, whose arrivals come from its own
+                random number generator, so that episodes started with the same
+                seed are reproducible.
         """
         # TODO: look into if we need options or not?
         super().reset(seed=seed)
+        if seed is not None:
+            self.passenger_generator.seed(seed)
         self.building.reset()
         self.step_num = 0
 
@@ -182,43 +218,47 @@ class RLevatorEnv(gym.Env):
             self.step_num
         )
 
-        env_actions = [NUM_TO_ACTION[action_num] for action_num in action]
-
-        self.building.execute_step(arrived_passengers, env_actions)
+        self.building.execute_step(arrived_passengers, action)
         self.step_num += 1
 
         terminated = self.step_num > self.termination_steps
-        reward = self.calculate_reward()
+        # Collect the reward components once and share them between the
+        # reward and the info
+        reward_components = self.building.get_reward_components()
+        reward = self.calculate_reward(reward_components)
         observation = self._get_obs()
-        info = self._get_info()
+        info = self._get_info(reward_components)
 
         if self.render_mode == "human":
             self._render_frame()
 
         return observation, reward, terminated, False, info
 
-    def calculate_reward(self):
+    def calculate_reward(self, reward_components=None):
         """
         Calculate the environment reward for the current state with the
         current reward weights.
 
+        Passenger list components count as their number of passengers. The
+        components are only read, so the same dictionary can be passed on to
+        _get_info afterwards.
+
+        Args:
+            reward_components : dict
+                Reward components from the building. If None, they are
+                collected from the building.
+
         Returns: float
         """
-        reward_components = self.building.get_reward_components()
-
-        reward_components['deboarding_passengers'] = len(
-            reward_components['deboarding_passengers']
-        )
-        reward_components['rejected_queue_passengers'] = len(
-            reward_components['rejected_queue_passengers']
-        )
-        reward_components['reached_max_wait_passengers'] = len(
-            reward_components['reached_max_wait_passengers']
-        )
+        if reward_components is None:
+            reward_components = self.building.get_reward_components()
 
         total_reward = 0.0
 
         for component, value in reward_components.items():
+            if isinstance(value, list):
+                value = len(value)
+
             total_reward += self.reward_weights[component] * value
 
         return total_reward
@@ -238,21 +278,41 @@ class RLevatorEnv(gym.Env):
         if self.observation_type == 'limited':
             obs = self.building.get_observation_limited()
             if self.flatten_space:
-                return spaces.utils.flatten(self.limited_obs_space, obs)
+                self._flat_elevator_buttons[:] = \
+                    obs['elevator_buttons'].ravel()
+                self._flat_queue_buttons[:] = obs['queue_buttons'].ravel()
+
+                self._flat_elevator_floors[:] = 0
+                self._flat_elevator_floors[
+                    self._elevator_indices, obs['elevator_floors']
+                ] = 1
+
+                # Copy so that observations kept by the caller are not
+                # overwritten on the next step
+                return self._flat_obs.copy()
             else:
-                return obs
+                # The building reuses its observation arrays between steps
+                return {key: value.copy() for key, value in obs.items()}
 
         # Should have thrown error when creating so we don't reach this yet
         return None
 
-    def _get_info(self):
+    def _get_info(self, reward_components=None):
         """
         Get the information we use to calculate reward components, but split
         out so we can track performance for each component.
 
+        Args:
+            reward_components : dict
+                Reward components from the building. If None, they are
+                collected from the building.
+
         Returns: dict
         """
-        return self.building.get_reward_components()
+        if reward_components is None:
+            return self.building.get_reward_components()
+
+        return reward_components
 
     def render(self):
         # TODO: this
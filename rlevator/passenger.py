@@ -1,4 +1,8 @@
 class Passenger(object):
+    # Passengers are created on every arrival, so avoid a per-instance dict
+    __slots__ = ('start_step', 'start_floor', 'destination_floor',
+                 'max_wait_steps', 'steps_age', 'steps_wait')
+
     def __init__(self, start_step, start_floor, destination_floor,
                  max_wait_steps=50):
         """
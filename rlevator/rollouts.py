@@ -0,0 +1,94 @@
+from rlevator.environment import RLevatorEnv
+
+from concurrent.futures import ProcessPoolExecutor
+from functools import partial
+
+
+def run_episode(seed, env_params=None, num_steps=None, policy=None):
+    """
+    Run a single episode in a freshly created environment and collect its
+    reward statistics. Every source of randomness is seeded from seed, and
+    nothing is shared with other episodes, so episodes can run independently
+    in parallel workers and are reproducible.
+
+    Args:
+        seed : int
+            Seed for the passenger arrivals, the environment and the default
+            random policy
+        env_params : dict
+            Keyword arguments for the RLevatorEnv constructor. If None, the
+            environment defaults are used.
+        num_steps : int
+            Maximum number of steps to run. If None, the episode runs until the
+            environment terminates.
+        policy : Callable
+            Function mapping an observation to an action. It must be picklable
+            when running episodes in worker processes. If None, actions are
+            sampled uniformly from the action space.
+
+    Returns: dict
+        Dictionary containing the seed, the number of steps run, the total
+        reward and the total of each reward component over the episode, where
+        passenger list components are totaled by their counts.
+    """
+    env = RLevatorEnv(**(env_params or {}))
+    env.action_space.seed(seed)
+
+    observation, _ = env.reset(seed=seed)
+
+    stats = {
+        'seed': seed,
+        'steps': 0,
+        'total_reward': 0.0
+    }
+
+    terminated = False
+    while not terminated and (num_steps is None or stats['steps'] < num_steps):
+        if policy is None:
+            action = env.action_space.sample()
+        else:
+            action = policy(observation)
+
+        observation, reward, terminated, _, info = env.step(action)
+
+        stats['steps'] += 1
+        stats['total_reward'] += reward
+
+        for component, value in info.items():
+            if isinstance(value, list):
+                value = len(value)
+            stats[component] = stats.get(component, 0) + value
+
+    env.close()
+
+    return stats
+
+
+def run_episodes(seeds, env_params=None, num_steps=None, policy=None,
+                 max_workers=None):
+    """
+    Run one independent episode per seed, spread across a pool of worker
+    processes.
+
+    Args:
+        seeds : List[int]
+            Seeds for each episode. Distinct seeds give independent episodes.
+        env_params : dict
+            Keyword arguments for the RLevatorEnv constructor
+        num_steps : int
+            Maximum number of steps to run in each episode
+        policy : Callable
+            Picklable function mapping an observation to an action, or None to
+            use random actions
+        max_workers : int
+            Number of worker processes. If None, one per available CPU.
+
+    Returns: List[dict]
+        Reward statistics from run_episode for each seed, in the same order as
+        the seeds.
+    """
+    episode = partial(run_episode, env_params=env_params, num_steps=num_steps,
+                      policy=policy)
+
+    with ProcessPoolExecutor(max_workers=max_workers) as executor:
+        return list(executor.map(episode, seeds))
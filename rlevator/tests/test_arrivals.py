@@ -1,6 +1,6 @@
-from rlevator.arrivals import PassengerArrivals
+from rlevator.arrivals import AliasSampler, PassengerArrivals
 
-from numpy import average, array
+from numpy import average, array, bincount, full
 
 NUM_FLOORS = 5
 NUM_ELEVATORS = 1
@@ -26,7 +26,7 @@ def test_generate_default_params_arrival_rates():
                                  DEFAULT_PARAMS['floor_arrival_rates']):
         arrival_rates_match &= abs(actual - generated) <= tol
 
-    assert arrival_rates_match is True
+    assert bool(arrival_rates_match) is True
 
 
 def test_generate_default_params_destination_rates():
@@ -48,7 +48,7 @@ def test_generate_default_params_destination_rates():
         for actual, generated in zip(actual_arr, generated_arr):
             destination_rates_match &= abs(actual - generated) <= tol
 
-    assert destination_rates_match is True
+    assert bool(destination_rates_match) is True
 
 
 def test_arrivals_sampling():
@@ -94,10 +94,10 @@ def test_destination_sampling():
     ]
 
     for _ in range(num_samples):
-        destination_dicts = PA_0.assign_destinations(arrivals)
-        for destination in destination_dicts:
-            start_floor = destination['start_floor']
-            destinations[start_floor][destination['destination_floor']] += 1
+        start_floors, destination_floors = PA_0.assign_destinations(arrivals)
+        for start_floor, destination_floor in zip(start_floors,
+                                                  destination_floors):
+            destinations[start_floor][destination_floor] += 1
 
     destinations_arr = array(destinations).astype(float)
     destinations_arr /= num_samples
@@ -123,3 +123,70 @@ def test_destination_sampling():
             destination_rates_match &= abs(actual - generated) <= tol
 
     assert bool(destinations_match) is True
+
+
+def test_destination_sampling_never_start_floor():
+    arrivals = [1000, 1000, 1000, 1000, 1000]
+
+    start_floors, destination_floors = PA_0.assign_destinations(arrivals)
+
+    assert bool((start_floors != destination_floors).all()) is True
+
+
+def test_alias_sampler_frequencies():
+    probabilities = [
+        [0.5, 0.25, 0.25, 0],
+        [0, 0, 0.1, 0.9]
+    ]
+    num_samples = 100000
+
+    sampler = AliasSampler(probabilities)
+
+    tol = 0.01
+
+    frequencies_match = True
+    for row, row_probabilities in enumerate(probabilities):
+        samples = sampler.sample(full(num_samples, row))
+        frequencies = bincount(samples, minlength=4) / num_samples
+        for actual, generated in zip(row_probabilities, frequencies):
+            frequencies_match &= abs(actual - generated) <= tol
+
+    assert bool(frequencies_match) is True
+
+
+def test_set_arrival_rates_applies_next_step():
+    generator = PassengerArrivals(**DEFAULT_PARAMS, seed=0)
+    generator.generate_arrivals()
+
+    generator.floor_arrival_rates = [0, 0, 0, 0, 100]
+
+    arrivals = generator.generate_arrivals()
+
+    assert bool((arrivals[:4] == 0).all() and arrivals[4] > 0) is True
+
+
+def test_set_destination_rates_rebuilds_sampler():
+    generator = PassengerArrivals(**DEFAULT_PARAMS, seed=0)
+
+    destination_rates = array(DEFAULT_PARAMS['floor_destination_rates'])
+    destination_rates[0] = [0, 0, 0, 0, 1]
+    generator.floor_destination_rates = destination_rates
+
+    _, destination_floors = generator.assign_destinations([100, 0, 0, 0, 0])
+
+    assert bool((destination_floors == 4).all()) is True
+
+
+def test_invalid_destination_rates_rejected():
+    destination_rates = array(DEFAULT_PARAMS['floor_destination_rates'])
+    destination_rates[1] = [0, 0, 0, 0, 0]
+
+    params = dict(DEFAULT_PARAMS, floor_destination_rates=destination_rates)
+
+    rejected = False
+    try:
+        PassengerArrivals(**params)
+    except Exception:
+        rejected = True
+
+    assert rejected is True
@@ -4,6 +4,8 @@ from rlevator.actions import Action
 
 from copy import deepcopy
 
+from numpy import array
+
 
 BUILDING_0 = Building(
     num_floors=10,
@@ -24,6 +26,16 @@ BUILDING_1 = Building(
 )
 
 
+BUILDING_4 = Building(
+    num_floors=10,
+    num_elevators=2,
+    max_queue=20,
+    elevator_capacities=[5, 8],
+    elevator_start_floors=3,
+    elevator_bounds=None
+)
+
+
 BUILDING_2 = deepcopy(BUILDING_0)
 
 PASSENGERS_0 = [
@@ -94,6 +106,19 @@ def test_elevators_bounds_non_default_top():
     assert BUILDING_1.elevators[1].get_max_floor() == 8
 
 
+def test_elevators_capacities_non_default():
+    capacities = [elevator.get_capacity() for elevator in BUILDING_4.elevators]
+
+    assert capacities == [5, 8]
+
+
+def test_elevators_start_floors_shared():
+    start_floors = [elevator.get_current_floor()
+                    for elevator in BUILDING_4.elevators]
+
+    assert start_floors == [3, 3]
+
+
 def test_add_passengers_queues_0():
     assert len(BUILDING_2.get_queue(2)) == 0
 
@@ -121,6 +146,127 @@ def test_queue_request_buttons_statuses():
     assert building_statuses == correct_building_statuses
 
 
+def test_queue_request_buttons_statuses_after_load():
+    building = deepcopy(BUILDING_3)
+    building.execute_action(0, Action.LOAD_UP)
+
+    building_statuses = building.queue_request_button_statuses()
+
+    correct_building_statuses = [
+        [False, True, False],
+        [False, True, False]
+    ]
+
+    assert building_statuses == correct_building_statuses
+
+
+def test_queue_request_buttons_statuses_direct_load():
+    building = deepcopy(BUILDING_3)
+    building.load(building.elevators[0], building.get_queue(0, True))
+
+    building_statuses = building.queue_request_button_statuses()
+
+    correct_building_statuses = [
+        [False, True, False],
+        [False, True, False]
+    ]
+
+    assert building_statuses == correct_building_statuses
+
+
+def test_queue_request_buttons_statuses_direct_max_wait_removal():
+    building = deepcopy(BUILDING_3)
+    queue = building.get_queue(0, True)
+
+    for passenger in queue:
+        passenger.steps_wait = 51
+
+    building.up_queues[0] = building.remove_max_wait_from_queue(queue)
+
+    building_statuses = building.queue_request_button_statuses()
+
+    correct_building_statuses = [
+        [False, True, False],
+        [False, True, False]
+    ]
+
+    assert building_statuses == correct_building_statuses
+
+
+def test_queue_request_buttons_statuses_direct_append():
+    building = deepcopy(BUILDING_3)
+    building.get_queue(2, False).append(Passenger(0, 2, 0))
+
+    building_statuses = building.queue_request_button_statuses()
+
+    correct_building_statuses = [
+        [True, True, False],
+        [False, True, True]
+    ]
+
+    assert building_statuses == correct_building_statuses
+    assert building.get_observation_limited()['queue_buttons'].tolist() == \
+        correct_building_statuses
+
+
+def test_observation_limited():
+    building = deepcopy(BUILDING_3)
+    building.execute_action(0, Action.LOAD_UP)
+    building.execute_action(1, Action.MOVE_UP)
+
+    observation = building.get_observation_limited()
+
+    assert observation['elevator_buttons'].tolist() == [
+        [False, True, False],
+        [False, False, False]
+    ]
+    assert observation['queue_buttons'].tolist() == [
+        [False, True, False],
+        [False, True, False]
+    ]
+    assert observation['elevator_floors'].tolist() == [0, 1]
+
+
+def test_observation_limited_direct_elevator_changes():
+    building = deepcopy(BUILDING_0)
+    building.get_observation_limited()
+
+    building.elevators[0].load_passengers([Passenger(0, 0, 3)])
+
+    observation = building.get_observation_limited()
+
+    assert observation['elevator_buttons'][0].tolist() == \
+        building.elevator_destination_bool_list()[0]
+
+    building.elevators[0].move(3)
+    building.elevators[0].unload_passengers()
+
+    observation = building.get_observation_limited()
+
+    assert not observation['elevator_buttons'].any()
+    assert observation['elevator_floors'].tolist() == [3, 0]
+
+
+def test_observation_limited_restricted_bounds():
+    building = Building(
+        num_floors=10,
+        num_elevators=1,
+        elevator_start_floors=2,
+        elevator_bounds=[[2, 5]]
+    )
+
+    building.elevators[0].load_passengers([Passenger(0, 2, 8),
+                                           Passenger(0, 2, 4)])
+
+    observation = building.get_observation_limited()
+
+    assert observation['elevator_buttons'][0].tolist() == [
+        False, False, False, False, True, False, False, False, False, False
+    ]
+    assert observation['elevator_buttons'][0, 2:6].tolist() == \
+        building.elevator_destination_bool_list()[0]
+
+
 def test_excess_passengers_max_queue():
     building = deepcopy(BUILDING_3)
 
@@ -168,6 +314,37 @@ def test_wait():
     assert building.elevators[1].floor == 2
 
 
+def test_invalid_action_rejected():
+    building = deepcopy(BUILDING_1)
+
+    rejected = False
+    try:
+        building.execute_step([], [Action.MOVE_UP, -1])
+    except ValueError:
+        rejected = True
+
+    # The valid action for the first elevator must not have run either
+    assert rejected is True
+    assert building.elevators[0].floor == 1
+
+    rejected = False
+    try:
+        building.execute_action(0, 6)
+    except ValueError:
+        rejected = True
+
+    assert rejected is True
+
+
+def test_numpy_actions_accepted():
+    building = deepcopy(BUILDING_1)
+
+    building.execute_step([], array([Action.MOVE_UP, Action.MOVE_DOWN]))
+
+    assert building.elevators[0].floor == 2
+    assert building.elevators[1].floor == 1
+
+
 def test_load_up_all():
     building = deepcopy(BUILDING_3)
     building.execute_action(0, Action.LOAD_UP)
@@ -231,6 +408,45 @@ def test_load_unload_count_elevator():
     assert building.elevators[0].get_count_passengers() == 1
 
 
+def test_reward_components_passengers_elevator():
+    building = deepcopy(BUILDING_3)
+
+    load_passengers = []
+    for _ in range(4):
+        load_passengers.append(Passenger(0, 0, 2))
+
+    building.add_arrivals_to_queues(load_passengers)
+
+    building.execute_action(0, Action.LOAD_UP)
+    building.execute_action(0, Action.MOVE_UP)
+    building.execute_action(0, Action.MOVE_UP)
+    building.execute_action(0, Action.UNLOAD)
+    building.execute_action(1, Action.LOAD_UP)
+
+    components = building.get_reward_components()
+
+    assert components['passengers_elevator'] == 3
+
+
+def test_reward_components_passengers_elevator_direct_changes():
+    building = deepcopy(BUILDING_0)
+
+    building.elevators[0].load_passengers([Passenger(0, 0, 3)])
+    building.elevators[1].load_passengers([Passenger(0, 0, 2),
+                                           Passenger(0, 0, 4)])
+
+    components = building.get_reward_components()
+
+    assert components['passengers_elevator'] == 3
+
+    building.elevators[1].move(2)
+    building.elevators[1].unload_passengers()
+
+    components = building.get_reward_components()
+
+    assert components['passengers_elevator'] == 2
+
+
 def test_increment_age():
     building = deepcopy(BUILDING_3)
 
@@ -300,6 +516,97 @@ def test_max_wait_removal():
     assert passenger_count == 3
 
 
+def test_reward_components_passengers_queues():
+    building = deepcopy(BUILDING_3)
+
+    max_wait_passengers = [
+        Passenger(0, 0, 1),
+        Passenger(0, 1, 2)
+    ]
+
+    for passenger in max_wait_passengers:
+        passenger.steps_wait = 51
+
+    building.add_arrivals_to_queues(max_wait_passengers)
+    building.execute_action(0, Action.LOAD_UP)
+    building.remove_max_wait_passengers()
+
+    passenger_count = 0
+    for queue in building.up_queues:
+        passenger_count += len(queue)
+
+    for queue in building.down_queues:
+        passenger_count += len(queue)
+
+    components = building.get_reward_components()
+
+    assert components['passengers_queues'] == passenger_count
+
+
+def test_reward_components_passengers_queues_direct_changes():
+    building = deepcopy(BUILDING_3)
+    queue = building.get_queue(0, True)
+
+    for passenger in queue:
+        passenger.steps_wait = 51
+
+    building.up_queues[0] = building.remove_max_wait_from_queue(queue)
+
+    components = building.get_reward_components()
+
+    assert components['passengers_queues'] == 2
+
+    building.get_queue(2, False).append(Passenger(0, 2, 0))
+
+    components = building.get_reward_components()
+
+    assert components['passengers_queues'] == 3
+
+
+def test_max_wait_removal_mixed_queue():
+    building = deepcopy(BUILDING_3)
+
+    passengers = [
+        Passenger(0, 0, 1),
+        Passenger(0, 0, 2),
+        Passenger(0, 0, 1)
+    ]
+
+    passengers[1].steps_wait = 51
+
+    building.add_arrivals_to_queues(passengers)
+
+    building.remove_max_wait_passengers()
+
+    # Floor zero's up queue already holds one passenger from PASSENGERS_1
+    assert list(building.up_queues[0])[1:] == [passengers[0], passengers[2]]
+    assert building.reached_max_wait_passengers == [passengers[1]]
+    assert building.get_reward_components()['passengers_queues'] == 5
+
+
+def test_max_wait_removal_from_queue_returns_new_queue():
+    building = deepcopy(BUILDING_3)
+
+    passengers = [
+        Passenger(0, 0, 1),
+        Passenger(0, 0, 2),
+        Passenger(0, 0, 1)
+    ]
+
+    passengers[1].steps_wait = 51
+
+    building.add_arrivals_to_queues(passengers)
+
+    queue = building.get_queue(0, True)
+    queue_before = list(queue)
+
+    new_queue = building.remove_max_wait_from_queue(queue)
+
+    assert list(queue) == queue_before
+    assert list(new_queue) == [queue_before[0], passengers[0], passengers[2]]
+    assert building.reached_max_wait_passengers == [passengers[1]]
+
+
 def test_max_wait_removal_queue():
     building = deepcopy(BUILDING_3)
 
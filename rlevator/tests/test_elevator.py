@@ -92,6 +92,36 @@ def test_destinations():
     assert floors == set([2, 5, 9])
 
 
+def test_destination_bool_list():
+    elevator = Elevator(
+        start_floor=5,
+        capacity=10,
+        min_floor=2,
+        max_floor=6
+    )
+    passengers = [Passenger(0, 5, 2), Passenger(0, 5, 4)]
+
+    elevator.load_passengers(passengers)
+
+    assert elevator.get_destination_bool_list() == [
+        True, False, True, False, False
+    ]
+
+
+def test_destination_bool_list_out_of_bounds():
+    elevator = Elevator(
+        start_floor=3,
+        capacity=10,
+        min_floor=2,
+        max_floor=5
+    )
+    passengers = [Passenger(0, 3, 8), Passenger(0, 3, 0)]
+
+    elevator.load_passengers(passengers)
+
+    assert elevator.get_destination_bool_list() == [False] * 4
+
+
 def test_move():
     elevator = deepcopy(TEST_ELEVATOR)
     floor_diff = 1
@@ -184,6 +214,18 @@ def test_unload_destination_floor_remaining_count():
     assert elevator.get_count_passengers() == 2
 
 
+def test_unload_destination_floor_remaining_destinations():
+    elevator = deepcopy(TEST_ELEVATOR)
+    passengers = deepcopy(TEST_PASSENGERS)
+
+    elevator.load_passengers(passengers)
+    elevator.move(2)
+
+    elevator.unload_passengers()
+
+    assert elevator.destination_floors() == set([5, 9])
+
+
 def test_correct_move_counts():
     elevator = deepcopy(TEST_ELEVATOR)
     passengers = deepcopy(TEST_PASSENGERS)
@@ -208,6 +250,17 @@ def test_incorrect_move_counts():
     assert elevator.count_incorrect_move_passengers(3) == 2
 
 
+def test_move_counts_no_move():
+    elevator = deepcopy(TEST_ELEVATOR)
+    passengers = deepcopy(TEST_PASSENGERS)
+
+    elevator.load_passengers(passengers)
+
+    # Staying on the same floor makes no progress for anyone
+
+    assert elevator.count_move_passengers(0) == (0, 4)
+
+
 def test_increment_passenger_steps_age():
     elevator = deepcopy(TEST_ELEVATOR)
     passengers = deepcopy(TEST_PASSENGERS)
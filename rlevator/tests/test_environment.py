@@ -0,0 +1,55 @@
+from rlevator.environment import RLevatorEnv
+
+from gymnasium import spaces
+
+
+def run_seeded_rewards(seed, num_steps=200):
+    env = RLevatorEnv(num_floors=5, num_elevators=2)
+    env.reset(seed=seed)
+    env.action_space.seed(seed)
+
+    rewards = []
+    for _ in range(num_steps):
+        _, reward, _, _, _ = env.step(env.action_space.sample())
+        rewards.append(reward)
+
+    return rewards
+
+
+def test_reset_seed_reproducible():
+    assert run_seeded_rewards(0) == run_seeded_rewards(0)
+
+
+def test_flattened_observation_matches_gymnasium():
+    for num_elevators in [1, 3]:
+        env = RLevatorEnv(num_floors=7, num_elevators=num_elevators)
+        env.reset(seed=0)
+        env.action_space.seed(0)
+
+        for _ in range(300):
+            observation, _, _, _, _ = env.step(env.action_space.sample())
+
+            expected_observation = spaces.utils.flatten(
+                env.limited_obs_space,
+                env.building.get_observation_limited()
+            )
+
+            assert observation.dtype == expected_observation.dtype
+            assert (observation == expected_observation).all()
+
+
+def test_info_passenger_lists_kept_after_step():
+    env = RLevatorEnv(num_floors=5, num_elevators=2)
+    env.reset(seed=0)
+    env.action_space.seed(0)
+
+    for _ in range(200):
+        _, _, _, _, info = env.step(env.action_space.sample())
+        kept_info = {component: list(value)
+                     for component, value in info.items()
+                     if isinstance(value, list)}
+
+        env.step(env.action_space.sample())
+
+        for component, value in kept_info.items():
+            assert info[component] == value
@@ -0,0 +1,31 @@
+from rlevator.rollouts import run_episode, run_episodes
+
+
+ENV_PARAMS = dict(
+    num_floors=5,
+    num_elevators=2
+)
+
+
+def test_run_episode_steps():
+    stats = run_episode(0, ENV_PARAMS, num_steps=50)
+
+    assert stats['steps'] == 50
+
+
+def test_run_episode_reproducible():
+    stats_0 = run_episode(0, ENV_PARAMS, num_steps=200)
+    stats_1 = run_episode(0, ENV_PARAMS, num_steps=200)
+
+    assert stats_0 == stats_1
+
+
+def test_run_episodes_matches_serial():
+    seeds = [0, 1]
+
+    parallel_stats = run_episodes(seeds, ENV_PARAMS, num_steps=50,
+                                  max_workers=2)
+    serial_stats = [run_episode(seed, ENV_PARAMS, num_steps=50)
+                    for seed in seeds]
+
+    assert parallel_stats == serial_stats
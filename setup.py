@@ -1,14 +1,7 @@
 #!/usr/bin/env python
 
-from distutils.core import setup
+# Package metadata lives in pyproject.toml. This shim keeps legacy
+# `python setup.py` invocations working.
+from setuptools import setup
 
-setup(name='RLevator',
-    version='0.2',
-    description='Gymnasium environment for elevator control',
-    author='Matthew Burke',
-    author_email='matthew.wesley.burke@gmail.com',
-    url='mwburke.github.io/rlevator',
-    packages=['rlevator'],
-    license='GNU GENERAL PUBLIC LICENSE',
-    long_description=open('README.md').read(),
-)
+setup()